@@ -9,4 +9,24 @@ class Settings:
     JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
     JIRA_EMAIL = os.getenv("JIRA_EMAIL")
 
+    # Pre-warm browser and HTTP pools in the background on startup
+    WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    # Deadlines in seconds for the whole validation run and for each stage
+    VALIDATION_TIMEOUT_SECONDS = float(os.getenv("VALIDATION_TIMEOUT_SECONDS", "600"))
+    JIRA_TIMEOUT_SECONDS = float(os.getenv("JIRA_TIMEOUT_SECONDS", "30"))
+    OPENAI_TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "120"))
+    UI_TESTS_TIMEOUT_SECONDS = float(os.getenv("UI_TESTS_TIMEOUT_SECONDS", "300"))
+
+    # Reuse a finished validation result for this many seconds (0 disables the window)
+    RESULT_WINDOW_SECONDS = float(os.getenv("RESULT_WINDOW_SECONDS", "0"))
+
+    # "inline" runs validations inside the API process, "queue" only enqueues them for run_worker.py
+    EXECUTION_MODE = os.getenv("EXECUTION_MODE", "inline").lower()
+    QUEUE_DB_PATH = os.getenv("QUEUE_DB_PATH", "qa_jobs.sqlite3")
+    JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    WORKER_PROCESSES = int(os.getenv("WORKER_PROCESSES", "0")) or (os.cpu_count() or 1)
+    WORKER_POLL_SECONDS = float(os.getenv("WORKER_POLL_SECONDS", "1"))
+
 settings = Settings()
@@ -5,14 +5,40 @@
 # if sys.platform.startswith("win"):
 #     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
+import time
+
+# Taken before the framework imports; used for cold-start reporting where the OS
+# cannot tell us when the process started
+_STARTED = time.monotonic()
+
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from app.core.config import settings
+from app.services import warmup
 from app.routes import jira, qa_agent
 
+warmup.mark_started(_STARTED)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so the server accepts /healthz immediately
+    names = warmup.QUEUE_MODE_API_WARMERS if settings.EXECUTION_MODE == "queue" else None
+    task = asyncio.create_task(warmup.warm_up(names)) if settings.WARMUP_ENABLED else None
+    if task is None:
+        warmup.state["ready"] = True
+    yield
+    if task is not None and not task.done():
+        task.cancel()
+
 
 app = FastAPI(
     title="Curacel AI QA Agent",
     description="Proof of concept agent that automates Jira QA testing using AI and Playwright.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Register routes
@@ -22,3 +48,14 @@ app.include_router(qa_agent.router, prefix="/qa", tags=["QA Agent"])
 @app.get("/")
 def home():
     return {"message": "Curacel AI QA Agent is running!"}
+
+@app.get("/healthz")
+def healthz():
+    """Liveness: the process is up and serving requests."""
+    return {"status": "ok"}
+
+@app.get("/readyz")
+def readyz():
+    """Readiness: warm-up finished. Also reports cold-start and first-validation timings."""
+    status_code = 200 if warmup.state["ready"] else 503
+    return JSONResponse(status_code=status_code, content=warmup.state)
@@ -1,36 +1,103 @@
-from fastapi import APIRouter
-from app.services import openai_service, ui_validator, jira_service
+import asyncio
+import json
+import anyio
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.services import job_queue, single_flight
+from app.services.qa_pipeline import run_validation_pipeline
 
 router = APIRouter()
 
+
+async def _cancel_on_disconnect(request: Request, coro):
+    """Await `coro`, cancelling it if the HTTP client goes away first."""
+    task = asyncio.ensure_future(coro)
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=1)
+        if done:
+            return task.result()
+        if await request.is_disconnected():
+            print(f"[QA AGENT] Client disconnected, cancelling {request.url.path}")
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return {"status": "cancelled"}
+
+
 @router.post("/run-validation/{ticket_id}")
-async def run_validation(ticket_id: str):
+async def run_validation(request: Request, ticket_id: str, updated: str | None = None):
     """
     Fetch Jira issue → Generate test steps via LLM → Execute UI validation asynchronously →
     Summarize results → Post feedback to Jira.
+    Concurrent calls for the same ticket share one run, which is cancelled if every caller
+    disconnects. `updated` (the ticket's Jira `updated` timestamp, e.g. from a webhook) makes
+    the call wait for a fresh run if the one in flight fetched an older revision.
+    In queue mode the job is only enqueued and picked up by run_worker.py processes; an
+    already queued or running job for the ticket is reused unless it is validating
+    another revision.
+    """
+    if settings.EXECUTION_MODE == "queue":
+        job_id = await anyio.to_thread.run_sync(job_queue.enqueue, ticket_id, updated)
+        return {"ticket_id": ticket_id, "job_id": job_id, "status": "queued"}
+
+    return await _cancel_on_disconnect(
+        request,
+        single_flight.run(ticket_id, lambda emit: run_validation_pipeline(ticket_id, emit), revision=updated),
+    )
+
+def _format_event(message, fmt: str):
+    if fmt == "sse":
+        return f"event: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+    return json.dumps(message) + "\n"
+
+@router.post("/run-validation/{ticket_id}/stream")
+async def run_validation_stream(ticket_id: str, updated: str | None = None, fmt: str = Query("sse", alias="format")):
     """
-    # Step 1: Fetch and simplify the Jira issue
-    issue = await jira_service.get_ticket(ticket_id)
-    if not issue or "llm_prompt" not in issue:
-        return {"error": f"Failed to retrieve or parse Jira issue {ticket_id}"}
-
-    # Step 2: Extract test steps from the LLM prompt
-    test_steps = await openai_service.generate_test_steps(issue["llm_prompt"])
-
-    # Step 3: Run automated UI validations asynchronously using Playwright
-    validation_results = await ui_validator.run_ui_tests(test_steps)
-
-    # Step 4: Summarize results for Jira comment
-    summary_comment = await openai_service.summarize_results(validation_results)
-
-    # Step 5: Post summary feedback to Jira
-    await jira_service.add_comment(ticket_id, summary_comment)
-
-    # Step 6: Return final structured response
-    return {
-        "ticket_id": ticket_id,
-        "summary": issue.get("summary"),
-        "status": "completed",
-        "results": validation_results,
-        "feedback_posted": summary_comment,
-    }
+    Same pipeline as /run-validation, streamed as it runs: ticket_fetched, test_step,
+    step_result, summary, comment_posted (or timed_out), then a final result event.
+    `format` is "sse" (text/event-stream) or "ndjson" (one JSON object per line).
+    """
+    if fmt not in ("sse", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'sse' or 'ndjson'")
+    media_type = "text/event-stream" if fmt == "sse" else "application/x-ndjson"
+
+    if settings.EXECUTION_MODE == "queue":
+        job_id = await anyio.to_thread.run_sync(job_queue.enqueue, ticket_id, updated)
+        queued = {"event": "queued", "data": {"ticket_id": ticket_id, "job_id": job_id, "status": "queued"}}
+        return StreamingResponse(iter([_format_event(queued, fmt)]), media_type=media_type)
+
+    queue = asyncio.Queue()
+
+    async def _run():
+        try:
+            result = await single_flight.run(
+                ticket_id,
+                lambda emit: run_validation_pipeline(ticket_id, emit),
+                on_event=queue.put_nowait,
+                revision=updated,
+            )
+            queue.put_nowait({"event": "result", "data": result})
+        except Exception as e:
+            queue.put_nowait({"event": "error", "data": {"error": str(e)}})
+        finally:
+            queue.put_nowait(None)
+
+    async def _events():
+        # Cancelled by the server when the client disconnects, which cancels our share of the run
+        task = asyncio.create_task(_run())
+        try:
+            while (message := await queue.get()) is not None:
+                yield _format_event(message, fmt)
+        finally:
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(_events(), media_type=media_type)
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """Return the status and result of a queued validation job."""
+    job = job_queue.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
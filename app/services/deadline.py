@@ -0,0 +1,52 @@
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+
+# Absolute monotonic deadline of the validation run in the current task, if any
+_deadline = contextvars.ContextVar("validation_deadline", default=None)
+
+# Extra time we keep waiting after a stage's budget, so calls that enforce the budget
+# themselves (e.g. the Playwright worker) can return their partial results
+STAGE_GRACE_SECONDS = 5.0
+
+
+class StageTimeout(Exception):
+    """Raised when a pipeline stage exceeds its budget or the overall run deadline."""
+
+    def __init__(self, stage: str):
+        super().__init__(f"Stage '{stage}' exceeded its deadline")
+        self.stage = stage
+
+
+@contextmanager
+def run_budget(seconds):
+    """Set the overall deadline for everything awaited inside the block."""
+    token = _deadline.set(time.monotonic() + seconds if seconds else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining(stage_budget=None):
+    """Seconds left for a stage: the smaller of its own budget and the run deadline."""
+    deadline = _deadline.get()
+    candidates = [b for b in (stage_budget, deadline - time.monotonic() if deadline else None) if b is not None]
+    return max(0.0, min(candidates)) if candidates else None
+
+
+async def run_stage(stage: str, stage_budget, call):
+    """
+    Await `call(timeout)` within the stage budget.
+    The timeout is handed to the call so it can stop on its own and return what it has;
+    we only cancel it if it is still running STAGE_GRACE_SECONDS after the budget.
+    """
+    timeout = remaining(stage_budget)
+    if timeout is not None and timeout <= 0:
+        raise StageTimeout(stage)
+    try:
+        return await asyncio.wait_for(call(timeout), timeout + STAGE_GRACE_SECONDS if timeout is not None else None)
+    except asyncio.TimeoutError:
+        print(f"[DEADLINE] Stage {stage} timed out after {timeout}s")
+        raise StageTimeout(stage) from None
@@ -1,4 +1,5 @@
 import re
+from datetime import datetime, timezone
 
 def extract_text_from_adf(adf):
     """Recursively extract plain text from Atlassian Document Format (ADF)."""
@@ -62,6 +63,7 @@ def simplify_jira_issue(issue):
     # --- Basic details ---
     summary = fields.get("summary", "")
     status = fields.get("status", {}).get("name", "")
+    updated = fields.get("updated")
     assignee = (
         fields.get("assignee", {}).get("displayName")
         if fields.get("assignee")
@@ -130,9 +132,39 @@ def simplify_jira_issue(issue):
         "key": issue.get("key"),
         "summary": summary,
         "status": status,
+        "updated": updated,
         "assignee": assignee,
         "context": context_text,
         "acceptance_criteria": acceptance_criteria,
         "comments": comments,
         "llm_prompt": llm_prompt,
     }
+
+
+def parse_jira_timestamp(value):
+    """Parse a Jira timestamp such as 2025-01-01T10:00:00.000+0000, or return None."""
+    if not value:
+        return None
+    for parse in (
+        lambda v: datetime.strptime(v, "%Y-%m-%dT%H:%M:%S.%f%z"),
+        datetime.fromisoformat,
+    ):
+        try:
+            parsed = parse(value)
+        except (TypeError, ValueError):
+            continue
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return None
+
+
+def revision_at_least(have, want):
+    """
+    True if ticket revision `have` (Jira `updated`) is the same as or newer than `want`.
+    Revisions that cannot be parsed are only considered equal to themselves.
+    """
+    if have == want:
+        return True
+    have_time, want_time = parse_jira_timestamp(have), parse_jira_timestamp(want)
+    if have_time is None or want_time is None:
+        return False
+    return have_time >= want_time
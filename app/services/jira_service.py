@@ -5,8 +5,23 @@ from requests.auth import HTTPBasicAuth
 from app.core.config import settings
 from app.services.jira_parser import simplify_jira_issue
 
+_session = None
 
-async def get_ticket(ticket_id: str):
+
+def _get_session():
+    """Shared requests session so Jira calls reuse pooled keep-alive connections."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
+def warm_up():
+    """Open a pooled connection to Jira so the first ticket fetch skips the TLS handshake."""
+    _get_session().head(settings.JIRA_BASE_URL, timeout=settings.JIRA_TIMEOUT_SECONDS)
+
+
+async def get_ticket(ticket_id: str, timeout=None):
     """
     Fetch a Jira issue asynchronously (runs requests in a background thread).
     """
@@ -15,7 +30,7 @@ async def get_ticket(ticket_id: str):
     headers = {"Accept": "application/json"}
 
     def _fetch():
-        response = requests.get(url, headers=headers, auth=auth)
+        response = _get_session().get(url, headers=headers, auth=auth, timeout=timeout or settings.JIRA_TIMEOUT_SECONDS)
         if response.status_code != 200:
             print(f"[JIRA ERROR] Failed to fetch ticket {ticket_id}: {response.status_code} {response.text}")
             return {"error": f"Unable to fetch Jira ticket {ticket_id}", "status": response.status_code}
@@ -27,7 +42,7 @@ async def get_ticket(ticket_id: str):
     return await anyio.to_thread.run_sync(_fetch)
 
 
-async def add_comment(ticket_id: str, comment):
+async def add_comment(ticket_id: str, comment, timeout=None):
     """
     Post a comment to a Jira issue asynchronously.
     Supports both plain text and Atlassian Document Format (ADF) JSON payloads.
@@ -57,7 +72,9 @@ async def add_comment(ticket_id: str, comment):
         raise TypeError("comment must be either a string or ADF JSON object (dict).")
 
     def _post():
-        response = requests.post(url, headers=headers, auth=auth, data=json.dumps(payload))
+        response = _get_session().post(
+            url, headers=headers, auth=auth, data=json.dumps(payload), timeout=timeout or settings.JIRA_TIMEOUT_SECONDS
+        )
         if response.status_code not in (200, 201):
             print(f"[JIRA ERROR] Failed to post comment on {ticket_id}: {response.status_code} {response.text}")
             return {"error": f"Unable to post comment on Jira ticket {ticket_id}", "status": response.status_code}
@@ -0,0 +1,238 @@
+import json
+import sqlite3
+import time
+import uuid
+from app.core.config import settings
+from app.services.jira_parser import revision_at_least
+
+# Journal mode is left at the SQLite default (not WAL) so the queue file also works
+# when several machines share it over a network filesystem.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    ticket_id TEXT NOT NULL,
+    revision TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_ticket_status ON jobs (ticket_id, status);
+"""
+
+
+def _connect(db_path=None):
+    """Open a connection in autocommit mode; transactions are started explicitly."""
+    conn = sqlite3.connect(db_path or settings.QUEUE_DB_PATH, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    # Queue files created before jobs tracked the ticket revision
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+    if "revision" not in columns:
+        conn.execute("ALTER TABLE jobs ADD COLUMN revision TEXT")
+    return conn
+
+
+def _row_to_job(row):
+    if row is None:
+        return None
+    job = dict(row)
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    return job
+
+
+def _reusable_job(active_jobs, revision):
+    """
+    Pick an active job that will validate at least `revision` (any revision if None),
+    following the same rules as the inline single-flight coalescing.
+    """
+    for job in active_jobs:
+        if revision is None or revision_at_least(job["revision"], revision):
+            return job
+        # Running but not fetched yet: it will see the latest ticket
+        if job["status"] == "running" and job["revision"] is None:
+            return job
+    # A job that has not started yet will fetch the latest ticket anyway
+    for job in active_jobs:
+        if job["status"] == "queued":
+            return job
+    return None
+
+
+def enqueue(ticket_id: str, revision=None, db_path=None):
+    """
+    Add a validation job for a Jira ticket and return its job id.
+    `revision` is the ticket's Jira `updated` timestamp if the caller knows it.
+    If a queued or running job for the ticket covers that revision (same or newer), its id
+    is returned instead; a running job for an older revision gets a new job queued behind it.
+    """
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        active_jobs = conn.execute(
+            "SELECT id, revision, status FROM jobs WHERE ticket_id = ? AND status IN ('queued', 'running') "
+            "ORDER BY created_at",
+            (ticket_id,),
+        ).fetchall()
+        job = _reusable_job(active_jobs, revision)
+        if job is not None:
+            # Record the newest revision asked for, never downgrade it
+            if revision is not None and not revision_at_least(job["revision"], revision):
+                conn.execute(
+                    "UPDATE jobs SET revision = ?, updated_at = ? WHERE id = ?", (revision, now, job["id"])
+                )
+            conn.execute("COMMIT")
+            return job["id"]
+        job_id = uuid.uuid4().hex
+        conn.execute(
+            "INSERT INTO jobs (id, ticket_id, revision, status, created_at, updated_at) "
+            "VALUES (?, ?, ?, 'queued', ?, ?)",
+            (job_id, ticket_id, revision, now, now),
+        )
+        conn.execute("COMMIT")
+        return job_id
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def get_job(job_id: str, db_path=None):
+    """Return the stored state of a job, or None if it does not exist."""
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    finally:
+        conn.close()
+    return _row_to_job(row)
+
+
+def claim(worker_id: str, lease_seconds=None, db_path=None):
+    """
+    Atomically lease the oldest runnable job to a worker.
+    Jobs whose lease expired (crashed or stuck worker) are runnable again until
+    they reach JOB_MAX_ATTEMPTS, after which they are marked failed.
+    """
+    lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        # Cheap read first so idle workers polling the queue never take the write lock
+        runnable = conn.execute(
+            "SELECT 1 FROM jobs WHERE status = 'queued' OR (status = 'running' AND lease_expires_at < ?) LIMIT 1",
+            (now,),
+        ).fetchone()
+        if runnable is None:
+            return None
+
+        # BEGIN IMMEDIATE takes the write lock up front so two workers never claim the same row
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "UPDATE jobs SET status = 'failed', error = 'Lease expired too many times', worker_id = NULL, "
+            "lease_expires_at = NULL, updated_at = ? "
+            "WHERE status = 'running' AND lease_expires_at < ? AND attempts >= ?",
+            (now, now, settings.JOB_MAX_ATTEMPTS),
+        )
+        row = conn.execute(
+            "SELECT id FROM jobs "
+            "WHERE status = 'queued' OR (status = 'running' AND lease_expires_at < ?) "
+            "ORDER BY created_at LIMIT 1",
+            (now,),
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        conn.execute(
+            "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker_id = ?, "
+            "lease_expires_at = ?, updated_at = ? WHERE id = ?",
+            (worker_id, now + lease_seconds, now, row["id"]),
+        )
+        job = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+        conn.execute("COMMIT")
+        return _row_to_job(job)
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def heartbeat(job_id: str, worker_id: str, lease_seconds=None, db_path=None):
+    """
+    Extend the lease on a running job.
+    Returns False if the worker no longer owns the job (lease was reclaimed).
+    """
+    lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(
+            "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+            "WHERE id = ? AND worker_id = ? AND status = 'running'",
+            (now + lease_seconds, now, job_id, worker_id),
+        )
+    finally:
+        conn.close()
+    return cursor.rowcount == 1
+
+
+def set_revision(job_id: str, worker_id: str, revision: str, db_path=None):
+    """Record the ticket revision a running job actually fetched."""
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            "UPDATE jobs SET revision = ?, updated_at = ? WHERE id = ? AND worker_id = ? AND status = 'running'",
+            (revision, time.time(), job_id, worker_id),
+        )
+    finally:
+        conn.close()
+
+
+def release(job_id: str, worker_id: str, db_path=None):
+    """
+    Put a running job back in the queue without counting the attempt, e.g. when its
+    worker shuts down cleanly. Returns False if the worker no longer owns the job.
+    """
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(
+            "UPDATE jobs SET status = 'queued', attempts = MAX(attempts - 1, 0), worker_id = NULL, "
+            "lease_expires_at = NULL, updated_at = ? "
+            "WHERE id = ? AND worker_id = ? AND status = 'running'",
+            (time.time(), job_id, worker_id),
+        )
+    finally:
+        conn.close()
+    return cursor.rowcount == 1
+
+
+def _finish(job_id, worker_id, status, result, error, db_path):
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, lease_expires_at = NULL, updated_at = ? "
+            "WHERE id = ? AND worker_id = ? AND status = 'running'",
+            (status, json.dumps(result) if result is not None else None, error, time.time(), job_id, worker_id),
+        )
+    finally:
+        conn.close()
+    return cursor.rowcount == 1
+
+
+def complete(job_id: str, worker_id: str, result, db_path=None):
+    """Store the result of a job. Returns False if the lease was lost in the meantime."""
+    return _finish(job_id, worker_id, "completed", result, None, db_path)
+
+
+def fail(job_id: str, worker_id: str, error: str, result=None, db_path=None):
+    """Mark a job as failed. Returns False if the lease was lost in the meantime."""
+    return _finish(job_id, worker_id, "failed", result, error, db_path)
@@ -2,15 +2,28 @@ import anyio
 import json
 import re
 import traceback
-from openai import OpenAI
 from app.core.config import settings
 from .prompt import SUMMARIZE_RESULTS_PROMPT, GENERATE_TEST_STEPS_PROMPT
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+_client = None
 
 
-async def generate_test_steps(prompt_text: str):
+def get_client():
+    """Return the shared OpenAI client, importing and building it on first use."""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        # No client-side retries: a retry would run past the stage deadline in an abandoned thread
+        _client = OpenAI(api_key=settings.OPENAI_API_KEY, timeout=settings.OPENAI_TIMEOUT_SECONDS, max_retries=0)
+    return _client
+
+
+def warm_up():
+    """Build the client and open its connection pool (TLS handshake) ahead of the first request."""
+    get_client().models.list()
+
+
+async def generate_test_steps(prompt_text: str, timeout=None):
     """
     Generate structured QA test steps asynchronously using OpenAI GPT.
     Ensures output is valid JSON list of {step, expected_result}.
@@ -19,7 +32,7 @@ async def generate_test_steps(prompt_text: str):
 
     def _run_openai_sync():
         try:
-            response = client.chat.completions.create(
+            response = get_client().chat.completions.create(
                 model="gpt-4-turbo",
                 temperature=0.3,
                 max_tokens=800,
@@ -27,6 +40,7 @@ async def generate_test_steps(prompt_text: str):
                     {"role": "system", "content": "You are an expert QA tester."},
                     {"role": "user", "content": user_prompt},
                 ],
+                timeout=timeout or settings.OPENAI_TIMEOUT_SECONDS,
             )
             content = response.choices[0].message.content.strip() if response.choices else ""
             if not content:
@@ -164,7 +178,7 @@ def convert_text_to_adf(text: str):
 
 
 
-async def summarize_results(results: str):
+async def summarize_results(results: str, timeout=None):
     """
     Summarize automated test results and return ADF JSON for Jira Cloud REST API.
     """
@@ -172,7 +186,7 @@ async def summarize_results(results: str):
 
     def _run_openai_sync():
         try:
-            response = client.chat.completions.create(
+            response = get_client().chat.completions.create(
                 model="gpt-4o",
                 temperature=0.4,
                 max_tokens=1500,
@@ -187,6 +201,7 @@ async def summarize_results(results: str):
                     },
                     {"role": "user", "content": user_prompt},
                 ],
+                timeout=timeout or settings.OPENAI_TIMEOUT_SECONDS,
             )
             content = response.choices[0].message.content.strip() if response.choices else ""
             if not content:
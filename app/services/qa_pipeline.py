@@ -0,0 +1,89 @@
+import time
+from app.core.config import settings
+from app.services import openai_service, ui_validator, jira_service, warmup, deadline
+
+
+async def run_validation_pipeline(ticket_id: str, emit=None):
+    """
+    Fetch Jira issue → Generate test steps via LLM → Execute UI validation →
+    Summarize results → Post feedback to Jira.
+    Shared by the API route (inline mode) and the queue workers (queue mode).
+    Every stage runs under its own budget and the overall VALIDATION_TIMEOUT_SECONDS;
+    on timeout the partial response is returned with status "timed_out".
+    `emit(event, data)` is called as each stage produces output, for streaming clients.
+    """
+    emit = emit or (lambda event, data: None)
+    started = time.monotonic()
+    response = {
+        "ticket_id": ticket_id,
+        "summary": None,
+        "updated": None,
+        "status": "running",
+        "results": None,
+        "feedback_posted": None,
+    }
+
+    with deadline.run_budget(settings.VALIDATION_TIMEOUT_SECONDS):
+        try:
+            # Step 1: Fetch and simplify the Jira issue
+            issue = await deadline.run_stage(
+                "fetch_ticket", settings.JIRA_TIMEOUT_SECONDS,
+                lambda timeout: jira_service.get_ticket(ticket_id, timeout=timeout),
+            )
+            if not issue or "llm_prompt" not in issue:
+                return {"error": f"Failed to retrieve or parse Jira issue {ticket_id}"}
+            response["summary"] = issue.get("summary")
+            response["updated"] = issue.get("updated")
+            emit("ticket_fetched", {
+                "ticket_id": ticket_id,
+                "summary": issue.get("summary"),
+                "status": issue.get("status"),
+                "updated": issue.get("updated"),
+                "acceptance_criteria": issue.get("acceptance_criteria"),
+            })
+
+            # Step 2: Extract test steps from the LLM prompt
+            test_steps = await deadline.run_stage(
+                "generate_test_steps", settings.OPENAI_TIMEOUT_SECONDS,
+                lambda timeout: openai_service.generate_test_steps(issue["llm_prompt"], timeout=timeout),
+            )
+            for index, step in enumerate(test_steps, start=1):
+                emit("test_step", {"index": index, "step": step})
+
+            # Step 3: Run automated UI validations asynchronously using Playwright
+            validation_results = await deadline.run_stage(
+                "ui_tests", settings.UI_TESTS_TIMEOUT_SECONDS,
+                lambda timeout: ui_validator.run_ui_tests(
+                    test_steps, timeout=timeout, on_result=lambda result: emit("step_result", result)
+                ),
+            )
+            response["results"] = validation_results
+            # The worker hit the budget itself: keep the steps it finished, skip summary and comment
+            if any(isinstance(r, dict) and r.get("timed_out") for r in validation_results):
+                raise deadline.StageTimeout("ui_tests")
+
+            # Step 4: Summarize results for Jira comment
+            summary_comment = await deadline.run_stage(
+                "summarize_results", settings.OPENAI_TIMEOUT_SECONDS,
+                lambda timeout: openai_service.summarize_results(validation_results, timeout=timeout),
+            )
+            emit("summary", summary_comment)
+
+            # Step 5: Post summary feedback to Jira
+            await deadline.run_stage(
+                "post_comment", settings.JIRA_TIMEOUT_SECONDS,
+                lambda timeout: jira_service.add_comment(ticket_id, summary_comment, timeout=timeout),
+            )
+            response["feedback_posted"] = summary_comment
+            emit("comment_posted", {"ticket_id": ticket_id})
+        except deadline.StageTimeout as e:
+            response["status"] = "timed_out"
+            response["timed_out_stage"] = e.stage
+            emit("timed_out", {"stage": e.stage})
+            return response
+
+    warmup.record_validation(time.monotonic() - started)
+
+    # Step 6: Return final structured response
+    response["status"] = "completed"
+    return response
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from app.core.config import settings
+from app.services.jira_parser import revision_at_least
+
+# Runs currently in progress and recently completed results, keyed by ticket id
+_in_flight = {}
+_recent = {}
+_waiters = {}
+
+# Ticket revision (Jira `updated` timestamp) each in-flight run is validating, once known
+_revisions = {}
+
+# Streaming subscribers and the events emitted so far, per in-flight run
+_subscribers = {}
+_history = {}
+
+
+def _purge_expired(now):
+    for key in [k for k, (expires_at, _, _) in _recent.items() if expires_at <= now]:
+        del _recent[key]
+
+
+def _broadcast(key, event: str, data):
+    if event == "ticket_fetched" and isinstance(data, dict) and data.get("updated"):
+        _revisions[key] = data["updated"]
+    message = {"event": event, "data": data}
+    _history.setdefault(key, []).append(message)
+    for subscriber in list(_subscribers.get(key, [])):
+        subscriber(message)
+
+
+def _forget(key, task):
+    """Drop the bookkeeping for `task`, unless a newer run already replaced it."""
+    if _in_flight.get(key) is task:
+        del _in_flight[key]
+        _history.pop(key, None)
+        _revisions.pop(key, None)
+
+
+def _start(key, coro_factory, revision):
+    _history[key] = []
+    _revisions[key] = revision
+
+    def emit(event, data):
+        # A cancelled run may still emit before it stops; keep it out of its successor's stream
+        if _in_flight.get(key) is task:
+            _broadcast(key, event, data)
+
+    task = asyncio.create_task(coro_factory(emit))
+    _in_flight[key] = task
+
+    def _on_done(t):
+        _forget(key, t)
+        if settings.RESULT_WINDOW_SECONDS <= 0 or t.cancelled() or t.exception() is not None:
+            return
+        result = t.result()
+        # Only successful runs are reused; errors and timeouts should be retried
+        if isinstance(result, dict) and result.get("status") == "completed":
+            _recent[key] = (time.monotonic() + settings.RESULT_WINDOW_SECONDS, result, result.get("updated"))
+
+    task.add_done_callback(_on_done)
+    return task
+
+
+async def run(key, coro_factory, on_event=None, revision=None):
+    """
+    Run `coro_factory(emit)` once per key and share its result with every concurrent caller.
+    `revision` is the ticket's `updated` timestamp if the caller knows it (e.g. a webhook);
+    a caller without one accepts whatever run is in flight. A caller whose revision is newer
+    than the one the in-flight run fetched waits for that run to finish and starts a fresh one.
+    `on_event` receives every progress event of the shared run, including those emitted
+    before this caller attached.
+    If RESULT_WINDOW_SECONDS > 0, callers arriving shortly after a completed run for the
+    same or a newer revision get the same result.
+    A cancelled caller (e.g. client disconnect) does not cancel the shared run for the
+    others; the run is only cancelled once every caller waiting on it is gone.
+    """
+    while True:
+        _purge_expired(time.monotonic())
+        if key in _recent:
+            _, result, result_revision = _recent[key]
+            if revision is None or revision_at_least(result_revision, revision):
+                return result
+            del _recent[key]
+
+        task = _in_flight.get(key)
+        if task is None:
+            task = _start(key, coro_factory, revision)
+            break
+        run_revision = _revisions.get(key)
+        if revision is not None and run_revision is not None and not revision_at_least(run_revision, revision):
+            print(f"[SINGLE FLIGHT] Run for {key} is validating an older revision, waiting to start a fresh one")
+            await asyncio.wait({task})
+            continue
+        print(f"[SINGLE FLIGHT] Attaching to in-flight run for {key}")
+        break
+
+    if on_event:
+        for message in _history.get(key, []):
+            on_event(message)
+        _subscribers.setdefault(key, []).append(on_event)
+
+    _waiters[key] = _waiters.get(key, 0) + 1
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if _waiters[key] == 1 and not task.done():
+            print(f"[SINGLE FLIGHT] No callers left, cancelling run for {key}")
+            task.cancel()
+            # Forget it now so a caller arriving before it finishes unwinding starts a new run
+            _forget(key, task)
+        raise
+    finally:
+        _waiters[key] -= 1
+        if not _waiters[key]:
+            del _waiters[key]
+        if on_event:
+            _subscribers[key].remove(on_event)
+            if not _subscribers[key]:
+                del _subscribers[key]
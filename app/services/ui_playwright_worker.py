@@ -4,8 +4,14 @@ import sys
 from playwright.sync_api import sync_playwright
 
 
-def run_tests(test_steps):
-    """Runs browser-based UI tests using Playwright."""
+def _write_result(result):
+    """Print one result as a JSON line so the parent can stream it immediately."""
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+
+
+def run_tests(test_steps, on_result=None):
+    """Runs browser-based UI tests using Playwright, reporting each result via `on_result`."""
     results = []
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
@@ -17,26 +23,37 @@ def run_tests(test_steps):
                 # Log to stderr so stdout stays clean for JSON
                 print(f"[WORKER] Executing test step: {step}", file=sys.stderr)
                 # Placeholder action simulation
-                results.append({"step": step, "status": "passed"})
+                result = {"step": step, "status": "passed"}
             except Exception as e:
-                results.append({"step": step, "status": "failed", "error": str(e)})
+                result = {"step": step, "status": "failed", "error": str(e)}
+            results.append(result)
+            if on_result:
+                on_result(result)
 
         browser.close()
     return results
 
 
+def check_install():
+    """Launch and close Chromium once to verify the browser is installed and can start."""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        browser.close()
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--check-install":
+        check_install()
+        sys.exit(0)
+
     try:
         # Read JSON argument from subprocess
         test_steps = json.loads(sys.argv[1]) if len(sys.argv) > 1 else []
-        results = run_tests(test_steps)
 
-        # Print ONLY valid JSON to stdout for parent process
-        sys.stdout.write(json.dumps(results))
-        sys.stdout.flush()
+        # Print ONLY JSON lines (one per step result) to stdout for parent process
+        run_tests(test_steps, on_result=_write_result)
 
     except Exception as e:
-        # Log errors safely as JSON
-        sys.stdout.write(json.dumps([{"error": str(e)}]))
-        sys.stdout.flush()
+        # Report on stderr; the parent turns a non-zero exit into a single error entry
+        print(f"[WORKER ERROR] {e}", file=sys.stderr)
         sys.exit(1)
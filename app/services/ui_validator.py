@@ -1,42 +1,131 @@
 import asyncio
 import json
+import os
+import signal
 import sys
 import subprocess
+import threading
 import traceback
+from app.core.config import settings
 
+WORKER_SCRIPT = "app/services/ui_playwright_worker.py"
 
-async def run_ui_tests(test_steps):
+
+async def run_ui_tests(test_steps, timeout=None, on_result=None):
     """
     Run automated UI tests using a separate Playwright subprocess.
     This approach isolates Playwright’s event loop (Windows-safe).
+    `on_result` is called on the event loop for each step result as the worker reports it.
+    If the caller is cancelled (deadline or client disconnect) the subprocess is killed.
     """
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _run_playwright_worker, test_steps)
+    procs = []
+    report = (lambda result: loop.call_soon_threadsafe(on_result, result)) if on_result else None
+    try:
+        return await loop.run_in_executor(None, _run_playwright_worker, test_steps, timeout, procs, report)
+    except asyncio.CancelledError:
+        for proc in procs:
+            _kill(proc)
+        raise
+
 
+def check_browser_install():
+    """
+    Launch Chromium once in a worker subprocess to verify the install.
+    Each validation still starts its own worker and browser, so this only catches a
+    missing browser early and primes the OS file cache; it does not keep a browser warm.
+    """
+    result = subprocess.run(
+        [sys.executable, WORKER_SCRIPT, "--check-install"],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=settings.UI_TESTS_TIMEOUT_SECONDS,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Playwright browser check failed: {result.stderr.strip()}")
 
-def _run_playwright_worker(test_steps):
-    """Executes a separate Python subprocess to run Playwright safely."""
+
+def _kill(proc):
+    """Kill the worker and the Chromium processes it spawned."""
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _run_playwright_worker(test_steps, timeout=None, procs=None, on_result=None):
+    """
+    Executes a separate Python subprocess to run Playwright safely.
+    The worker prints one JSON line per step result, which is read as it arrives.
+    """
     try:
         # Ensure JSON serialization
         test_data = json.dumps(test_steps)
 
-        result = subprocess.run(
-            [sys.executable, "app/services/ui_playwright_worker.py", test_data],
-            capture_output=True,
+        # Own process group on POSIX so the browser children can be killed with the worker
+        proc = subprocess.Popen(
+            [sys.executable, WORKER_SCRIPT, test_data],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False
+            start_new_session=(os.name == "posix"),
         )
+        if procs is not None:
+            procs.append(proc)
+
+        # Drain stderr in the background so a chatty worker cannot block on a full pipe
+        stderr_chunks = []
+        stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        stderr_thread.start()
+
+        timed_out = threading.Event()
 
-        if result.returncode != 0:
-            print("[PLAYWRIGHT STDERR]", result.stderr)
-            return [{"error": f"Playwright subprocess failed: {result.stderr.strip()}"}]
+        def _on_timeout():
+            timed_out.set()
+            _kill(proc)
 
-        # Parse results from subprocess stdout
+        timer = threading.Timer(timeout, _on_timeout) if timeout is not None else None
+        if timer:
+            timer.start()
+
+        results = []
         try:
-            return json.loads(result.stdout or "[]")
-        except json.JSONDecodeError:
-            print("[PLAYWRIGHT OUTPUT PARSE ERROR]", result.stdout)
-            return [{"error": "Failed to parse Playwright test results."}]
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    result = json.loads(line)
+                except json.JSONDecodeError:
+                    print("[PLAYWRIGHT OUTPUT PARSE ERROR]", line)
+                    result = {"error": "Failed to parse Playwright test result."}
+                results.append(result)
+                if on_result:
+                    on_result(result)
+            proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            stderr_thread.join()
+            proc.stdout.close()
+            proc.stderr.close()
+        stderr = "".join(stderr_chunks)
+
+        if timed_out.is_set():
+            print(f"[PLAYWRIGHT TIMEOUT] Worker killed after {timeout}s")
+            return results + [{"error": f"Playwright subprocess timed out after {timeout}s", "timed_out": True}]
+
+        if proc.returncode != 0:
+            print("[PLAYWRIGHT STDERR]", stderr)
+            return results + [{"error": f"Playwright subprocess failed: {stderr.strip()}"}]
+
+        return results
 
     except Exception as e:
         print("[PLAYWRIGHT CRITICAL ERROR]", e)
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import time
+import traceback
+import anyio
+
+
+def _process_start_time():
+    """Monotonic timestamp of when this process started (Linux /proc), or None if unknown."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime, in clock ticks since boot); fields restart after the ")" of the name
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return time.monotonic() - (uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# Cold start is measured from process start, including interpreter and framework imports
+_BOOT_TIME = _process_start_time() or time.monotonic()
+
+
+def mark_started(timestamp: float):
+    """Move the boot clock back to `timestamp` if the process start time is unavailable."""
+    global _BOOT_TIME
+    _BOOT_TIME = min(_BOOT_TIME, timestamp)
+
+state = {
+    "ready": False,
+    "components": {},
+    "cold_start_seconds": None,
+    "first_validation": None,
+}
+
+
+def _warm_openai():
+    from app.services import openai_service
+    openai_service.warm_up()
+
+
+def _warm_jira():
+    from app.services import jira_service
+    jira_service.warm_up()
+
+
+def _check_browser():
+    from app.services import ui_validator
+    ui_validator.check_browser_install()
+
+
+WARMERS = {
+    "openai": _warm_openai,
+    "jira": _warm_jira,
+    "browser_install": _check_browser,
+}
+
+
+async def _run_warmer(name, warmer):
+    started = time.monotonic()
+    state["components"][name] = {"status": "warming"}
+    try:
+        await anyio.to_thread.run_sync(warmer)
+        state["components"][name] = {"status": "ok", "seconds": round(time.monotonic() - started, 3)}
+    except Exception as e:
+        print(f"[WARMUP ERROR] {name}: {e}")
+        traceback.print_exc()
+        state["components"][name] = {"status": "error", "error": str(e), "seconds": round(time.monotonic() - started, 3)}
+
+
+# Only Jira is used by the API process in queue mode; validations run in the workers
+QUEUE_MODE_API_WARMERS = ("jira",)
+
+
+async def warm_up(names=None):
+    """
+    Warm the given components (default: all) concurrently, then mark the app ready.
+    A failing component is reported but does not block readiness; the first
+    validation will simply pay its cold-start cost.
+    """
+    names = names or WARMERS.keys()
+    await asyncio.gather(*(_run_warmer(name, WARMERS[name]) for name in names))
+    state["cold_start_seconds"] = round(time.monotonic() - _BOOT_TIME, 3)
+    state["ready"] = True
+    print(f"[WARMUP] Ready after {state['cold_start_seconds']}s: {state['components']}")
+
+
+def record_validation(duration_seconds: float):
+    """Record timing of the first validation since boot."""
+    if state["first_validation"] is not None:
+        return
+    state["first_validation"] = {
+        "seconds_since_boot": round(time.monotonic() - _BOOT_TIME, 3),
+        "duration_seconds": round(duration_seconds, 3),
+    }
+    print(f"[WARMUP] First validation: {state['first_validation']}")
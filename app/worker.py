@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+import anyio
+from app.core.config import settings
+from app.services import job_queue, warmup
+
+
+async def _run_job(job, worker_id):
+    """
+    Run the pipeline for a claimed job while renewing its lease.
+    If a heartbeat finds the lease was reclaimed by another worker, the pipeline is
+    cancelled (killing its Playwright subprocess) so the job is never run twice.
+    """
+    from app.services.qa_pipeline import run_validation_pipeline
+
+    def emit(event, data):
+        # Store the fetched revision so enqueue can tell which revision this job covers.
+        # A single quick UPDATE; this worker process runs nothing else concurrently.
+        if event == "ticket_fetched" and isinstance(data, dict) and data.get("updated"):
+            job_queue.set_revision(job["id"], worker_id, data["updated"])
+
+    pipeline = asyncio.create_task(run_validation_pipeline(job["ticket_id"], emit))
+    while True:
+        done, _ = await asyncio.wait({pipeline}, timeout=settings.JOB_LEASE_SECONDS / 3)
+        if done:
+            return pipeline.result()
+        if not await anyio.to_thread.run_sync(job_queue.heartbeat, job["id"], worker_id):
+            print(f"[WORKER {worker_id}] Lost lease on job {job['id']}, cancelling run")
+            pipeline.cancel()
+            await asyncio.gather(pipeline, return_exceptions=True)
+            return None
+
+
+def worker_loop(index: int):
+    """Claim and run validation jobs forever. One call per worker process."""
+    # SIGTERM from the supervisor raises KeyboardInterrupt, so asyncio.run cancels the
+    # running pipeline and its Playwright subprocess is killed before we exit
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{index}"
+    print(f"[WORKER {worker_id}] Started, polling {settings.QUEUE_DB_PATH}")
+    if settings.WARMUP_ENABLED:
+        asyncio.run(warmup.warm_up())
+
+    try:
+        while True:
+            job = job_queue.claim(worker_id)
+            if job is None:
+                time.sleep(settings.WORKER_POLL_SECONDS)
+                continue
+
+            print(f"[WORKER {worker_id}] Running job {job['id']} for {job['ticket_id']} (attempt {job['attempts']})")
+            try:
+                result = asyncio.run(_run_job(job, worker_id))
+                if result is None:
+                    continue
+                if isinstance(result, dict) and "error" in result:
+                    job_queue.fail(job["id"], worker_id, result["error"], result)
+                elif isinstance(result, dict) and result.get("status") == "timed_out":
+                    # No summary or Jira comment was posted, so this is not a success
+                    job_queue.fail(job["id"], worker_id, f"Timed out at stage {result.get('timed_out_stage')}", result)
+                else:
+                    job_queue.complete(job["id"], worker_id, result)
+            except KeyboardInterrupt:
+                # Shutting down (deploy/restart): hand the job straight back to the queue
+                job_queue.release(job["id"], worker_id)
+                print(f"[WORKER {worker_id}] Released job {job['id']}")
+                raise
+            except Exception as e:
+                traceback.print_exc()
+                job_queue.fail(job["id"], worker_id, str(e))
+    except KeyboardInterrupt:
+        print(f"[WORKER {worker_id}] Stopping")
+
+
+def _spawn(index: int):
+    process = multiprocessing.Process(target=worker_loop, args=(index,), name=f"qa-worker-{index}")
+    process.start()
+    return process
+
+
+def main(processes=None):
+    """
+    Start `processes` worker processes and supervise them.
+    Workers that exit are restarted; SIGTERM/SIGINT to the parent are forwarded to them.
+    """
+    processes = processes or settings.WORKER_PROCESSES
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+
+    workers = {i: _spawn(i) for i in range(processes)}
+    try:
+        while not stopping.wait(settings.WORKER_POLL_SECONDS):
+            for i, w in workers.items():
+                if not w.is_alive():
+                    print(f"[WORKER POOL] {w.name} exited with code {w.exitcode}, restarting")
+                    workers[i] = _spawn(i)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("[WORKER POOL] Stopping workers")
+        for w in workers.values():
+            if w.is_alive():
+                w.terminate()
+        for w in workers.values():
+            w.join(timeout=30)
+            if w.is_alive():
+                w.kill()
+                w.join()
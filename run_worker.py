@@ -0,0 +1,14 @@
+import argparse
+import asyncio
+import platform
+
+if platform.system() == "Windows":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+from app.worker import main
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run QA validation workers against the shared job queue.")
+    parser.add_argument("--processes", type=int, default=None, help="Number of worker processes (default: WORKER_PROCESSES or CPU count)")
+    args = parser.parse_args()
+    main(args.processes)
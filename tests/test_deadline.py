@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+from app.services import deadline
+
+
+def test_remaining_without_any_budget_is_unbounded():
+    assert deadline.remaining() is None
+
+
+def test_remaining_uses_stage_budget_outside_a_run():
+    assert deadline.remaining(30) == 30
+
+
+def test_remaining_is_capped_by_run_deadline():
+    with deadline.run_budget(1):
+        assert deadline.remaining(30) <= 1
+        assert deadline.remaining(0.5) == 0.5
+    assert deadline.remaining(30) == 30
+
+
+def test_run_stage_passes_timeout_to_call():
+    seen = []
+
+    async def call(timeout):
+        seen.append(timeout)
+        return "ok"
+
+    assert asyncio.run(deadline.run_stage("stage", 10, call)) == "ok"
+    assert seen == [10]
+
+
+def test_run_stage_raises_stage_timeout_after_grace(monkeypatch):
+    monkeypatch.setattr(deadline, "STAGE_GRACE_SECONDS", 0.01)
+
+    async def call(timeout):
+        await asyncio.sleep(5)
+
+    with pytest.raises(deadline.StageTimeout) as exc:
+        asyncio.run(deadline.run_stage("ui_tests", 0.01, call))
+    assert exc.value.stage == "ui_tests"
+
+
+def test_run_stage_lets_call_return_within_grace(monkeypatch):
+    monkeypatch.setattr(deadline, "STAGE_GRACE_SECONDS", 1)
+
+    async def call(timeout):
+        await asyncio.sleep(timeout)
+        return ["partial"]
+
+    assert asyncio.run(deadline.run_stage("ui_tests", 0.01, call)) == ["partial"]
+
+
+def test_run_stage_fails_fast_when_run_deadline_passed():
+    async def scenario():
+        with deadline.run_budget(0.01):
+            await asyncio.sleep(0.02)
+            await deadline.run_stage("summarize_results", 10, lambda timeout: asyncio.sleep(0))
+
+    with pytest.raises(deadline.StageTimeout):
+        asyncio.run(scenario())
@@ -0,0 +1,84 @@
+import threading
+import time
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.main import app
+from app.services import warmup
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(warmup, "state", {
+        "ready": False,
+        "components": {},
+        "cold_start_seconds": None,
+        "first_validation": None,
+    })
+    monkeypatch.setattr(settings, "WARMUP_ENABLED", True)
+    monkeypatch.setattr(settings, "EXECUTION_MODE", "inline")
+
+
+def _wait_until_ready(client):
+    for _ in range(100):
+        response = client.get("/readyz")
+        if response.status_code == 200:
+            return response
+        time.sleep(0.02)
+    raise AssertionError("app never became ready")
+
+
+def test_readyz_is_503_while_warming_then_200(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(warmup, "WARMERS", {"jira": lambda: release.wait(5)})
+
+    with TestClient(app) as client:
+        assert client.get("/healthz").json() == {"status": "ok"}
+        response = client.get("/readyz")
+        assert response.status_code == 503
+        assert response.json()["components"]["jira"]["status"] == "warming"
+
+        release.set()
+        body = _wait_until_ready(client).json()
+
+    assert body["ready"] is True
+    assert body["components"]["jira"]["status"] == "ok"
+    assert body["cold_start_seconds"] > 0
+
+
+def test_failing_warmer_does_not_block_readiness(monkeypatch):
+    def broken():
+        raise RuntimeError("no browser")
+
+    monkeypatch.setattr(warmup, "WARMERS", {"jira": lambda: None, "browser_install": broken})
+
+    with TestClient(app) as client:
+        body = _wait_until_ready(client).json()
+
+    assert body["components"]["jira"]["status"] == "ok"
+    assert body["components"]["browser_install"] == {
+        "status": "error",
+        "error": "no browser",
+        "seconds": body["components"]["browser_install"]["seconds"],
+    }
+
+
+def test_queue_mode_api_only_warms_jira(monkeypatch):
+    warmed = []
+    monkeypatch.setattr(settings, "EXECUTION_MODE", "queue")
+    monkeypatch.setattr(warmup, "WARMERS", {
+        name: (lambda name=name: warmed.append(name)) for name in ("openai", "jira", "browser_install")
+    })
+
+    with TestClient(app) as client:
+        body = _wait_until_ready(client).json()
+
+    assert warmed == ["jira"]
+    assert list(body["components"]) == ["jira"]
+
+
+def test_readyz_is_200_immediately_when_warmup_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "WARMUP_ENABLED", False)
+
+    with TestClient(app) as client:
+        assert client.get("/readyz").status_code == 200
@@ -0,0 +1,24 @@
+from app.services.jira_parser import parse_jira_timestamp, revision_at_least
+
+
+def test_parse_jira_timestamp_handles_jira_format():
+    parsed = parse_jira_timestamp("2025-01-01T10:00:00.000+0100")
+    assert parsed.isoformat() == "2025-01-01T10:00:00+01:00"
+
+
+def test_parse_jira_timestamp_rejects_garbage():
+    assert parse_jira_timestamp("not a date") is None
+    assert parse_jira_timestamp(None) is None
+
+
+def test_revision_at_least_compares_as_datetimes():
+    older = "2025-01-01T10:00:00.000+0000"
+    newer = "2025-01-01T10:30:00.000+0100"  # 09:30 UTC is actually older
+    assert revision_at_least(older, older)
+    assert revision_at_least(older, newer)
+    assert not revision_at_least(newer, older)
+
+
+def test_revision_at_least_falls_back_to_equality():
+    assert revision_at_least("abc", "abc")
+    assert not revision_at_least("abc", "2025-01-01T10:00:00.000+0000")
@@ -0,0 +1,169 @@
+import time
+import pytest
+from app.core.config import settings
+from app.services import job_queue
+
+R1 = "2025-01-01T10:00:00.000+0000"
+R2 = "2025-01-01T11:00:00.000+0000"
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "jobs.sqlite3")
+
+
+def _expire_lease():
+    time.sleep(0.05)
+
+
+def test_claim_returns_none_when_queue_is_empty(db):
+    assert job_queue.claim("w1", db_path=db) is None
+
+
+def test_claim_leases_oldest_job(db):
+    first = job_queue.enqueue("T-1", db_path=db)
+    job_queue.enqueue("T-2", db_path=db)
+
+    job = job_queue.claim("w1", db_path=db)
+
+    assert job["id"] == first
+    assert job["status"] == "running"
+    assert job["worker_id"] == "w1"
+    assert job["attempts"] == 1
+
+
+def test_live_lease_is_not_claimed_twice(db):
+    job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", db_path=db)
+
+    assert job_queue.claim("w2", db_path=db) is None
+
+
+def test_expired_lease_is_reclaimed_and_stale_worker_is_rejected(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", lease_seconds=0.01, db_path=db)
+    _expire_lease()
+
+    job = job_queue.claim("w2", db_path=db)
+
+    assert job["id"] == job_id
+    assert job["worker_id"] == "w2"
+    assert job["attempts"] == 2
+    assert job_queue.heartbeat(job_id, "w1", db_path=db) is False
+    assert job_queue.complete(job_id, "w1", {"status": "completed"}, db_path=db) is False
+    assert job_queue.heartbeat(job_id, "w2", db_path=db) is True
+    assert job_queue.complete(job_id, "w2", {"status": "completed"}, db_path=db) is True
+
+    stored = job_queue.get_job(job_id, db_path=db)
+    assert stored["status"] == "completed"
+    assert stored["result"] == {"status": "completed"}
+
+
+def test_heartbeat_keeps_job_from_being_reclaimed(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", lease_seconds=0.01, db_path=db)
+
+    assert job_queue.heartbeat(job_id, "w1", lease_seconds=60, db_path=db) is True
+    _expire_lease()
+    assert job_queue.claim("w2", db_path=db) is None
+
+
+def test_job_fails_after_max_attempts(db, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_MAX_ATTEMPTS", 1)
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", lease_seconds=0.01, db_path=db)
+    _expire_lease()
+
+    assert job_queue.claim("w2", db_path=db) is None
+    stored = job_queue.get_job(job_id, db_path=db)
+    assert stored["status"] == "failed"
+    assert stored["error"] == "Lease expired too many times"
+
+
+def test_fail_records_error(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", db_path=db)
+
+    assert job_queue.fail(job_id, "w1", "boom", db_path=db) is True
+    stored = job_queue.get_job(job_id, db_path=db)
+    assert stored["status"] == "failed"
+    assert stored["error"] == "boom"
+
+
+def test_release_requeues_job_without_counting_the_attempt(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", db_path=db)
+
+    assert job_queue.release(job_id, "w2", db_path=db) is False
+    assert job_queue.release(job_id, "w1", db_path=db) is True
+
+    stored = job_queue.get_job(job_id, db_path=db)
+    assert stored["status"] == "queued"
+    assert stored["attempts"] == 0
+    assert stored["worker_id"] is None
+
+    job = job_queue.claim("w2", db_path=db)
+    assert job["id"] == job_id
+    assert job["attempts"] == 1
+
+
+def test_enqueue_reuses_active_job_for_same_ticket(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+
+    assert job_queue.enqueue("T-1", db_path=db) == job_id
+    assert job_queue.enqueue("T-2", db_path=db) != job_id
+
+
+def test_enqueue_queues_new_job_after_completion(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", db_path=db)
+    job_queue.complete(job_id, "w1", {"status": "completed"}, db_path=db)
+
+    assert job_queue.enqueue("T-1", db_path=db) != job_id
+
+
+def test_enqueue_with_newer_revision_does_not_reuse_running_job(db):
+    job_id = job_queue.enqueue("T-1", revision=R1, db_path=db)
+    job_queue.claim("w1", db_path=db)
+
+    assert job_queue.enqueue("T-1", revision=R1, db_path=db) == job_id
+    newer = job_queue.enqueue("T-1", revision=R2, db_path=db)
+    assert newer != job_id
+    assert job_queue.enqueue("T-1", revision=R2, db_path=db) == newer
+
+
+def test_enqueue_with_older_revision_reuses_running_job(db):
+    job_id = job_queue.enqueue("T-1", revision=R2, db_path=db)
+    job_queue.claim("w1", db_path=db)
+
+    assert job_queue.enqueue("T-1", revision=R1, db_path=db) == job_id
+
+
+def test_enqueue_reuses_running_job_with_unknown_revision(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", db_path=db)
+
+    assert job_queue.enqueue("T-1", revision=R2, db_path=db) == job_id
+
+
+def test_enqueue_uses_fetched_revision_of_running_job(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+    job_queue.claim("w1", db_path=db)
+    job_queue.set_revision(job_id, "w1", R1, db_path=db)
+
+    assert job_queue.enqueue("T-1", revision=R1, db_path=db) == job_id
+    assert job_queue.enqueue("T-1", revision=R2, db_path=db) != job_id
+
+
+def test_enqueue_with_new_revision_reuses_queued_job(db):
+    job_id = job_queue.enqueue("T-1", db_path=db)
+
+    assert job_queue.enqueue("T-1", revision=R2, db_path=db) == job_id
+    assert job_queue.get_job(job_id, db_path=db)["revision"] == R2
+
+
+def test_enqueue_never_downgrades_queued_revision(db):
+    job_id = job_queue.enqueue("T-1", revision=R2, db_path=db)
+
+    assert job_queue.enqueue("T-1", revision=R1, db_path=db) == job_id
+    assert job_queue.get_job(job_id, db_path=db)["revision"] == R2
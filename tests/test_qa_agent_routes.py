@@ -0,0 +1,72 @@
+import asyncio
+import json
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.main import app
+from app.routes import qa_agent
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "EXECUTION_MODE", "inline")
+
+    async def fake_pipeline(ticket_id, emit=None):
+        emit("ticket_fetched", {"ticket_id": ticket_id, "updated": None})
+        await asyncio.sleep(0)
+        emit("step_result", {"step": "a", "status": "passed"})
+        return {"ticket_id": ticket_id, "status": "completed"}
+
+    monkeypatch.setattr(qa_agent, "run_validation_pipeline", fake_pipeline)
+    return TestClient(app)
+
+
+def test_format_event_sse():
+    message = {"event": "step_result", "data": {"step": "a"}}
+    assert qa_agent._format_event(message, "sse") == 'event: step_result\ndata: {"step": "a"}\n\n'
+
+
+def test_format_event_ndjson():
+    message = {"event": "step_result", "data": {"step": "a"}}
+    assert qa_agent._format_event(message, "ndjson") == json.dumps(message) + "\n"
+
+
+def test_stream_ndjson(client):
+    response = client.post("/qa/run-validation/T-1/stream?format=ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e["event"] for e in events] == ["ticket_fetched", "step_result", "result"]
+    assert events[-1]["data"] == {"ticket_id": "T-1", "status": "completed"}
+
+
+def test_stream_sse_is_default(client):
+    response = client.post("/qa/run-validation/T-1/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = [f for f in response.text.split("\n\n") if f]
+    assert [f.splitlines()[0] for f in frames] == [
+        "event: ticket_fetched",
+        "event: step_result",
+        "event: result",
+    ]
+    assert json.loads(frames[-1].splitlines()[1][len("data: "):])["status"] == "completed"
+
+
+def test_stream_rejects_unknown_format(client):
+    response = client.post("/qa/run-validation/T-1/stream?format=xml")
+
+    assert response.status_code == 400
+
+
+def test_stream_in_queue_mode_reports_job(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "EXECUTION_MODE", "queue")
+    monkeypatch.setattr(settings, "QUEUE_DB_PATH", str(tmp_path / "jobs.sqlite3"))
+
+    response = client.post("/qa/run-validation/T-1/stream?format=ndjson")
+
+    event = json.loads(response.text)
+    assert event["event"] == "queued"
+    assert event["data"]["job_id"]
@@ -0,0 +1,188 @@
+import asyncio
+import pytest
+from app.core.config import settings
+from app.services import single_flight
+
+R1 = "2025-01-01T10:00:00.000+0000"
+R2 = "2025-01-01T11:00:00.000+0000"
+
+
+@pytest.fixture(autouse=True)
+def no_result_window(monkeypatch):
+    monkeypatch.setattr(settings, "RESULT_WINDOW_SECONDS", 0)
+    single_flight._recent.clear()
+    yield
+    single_flight._recent.clear()
+
+
+def _pipeline(calls, result=None, delay=0.05, revision=None):
+    """Fake pipeline that records its runs and emits ticket_fetched like the real one."""
+    async def run(emit):
+        calls.append(revision)
+        emit("ticket_fetched", {"updated": revision})
+        await asyncio.sleep(delay)
+        return result if result is not None else {"status": "completed", "updated": revision}
+    return run
+
+
+def test_concurrent_callers_share_one_run():
+    calls = []
+
+    async def scenario():
+        return await asyncio.gather(*(single_flight.run("T-1", _pipeline(calls)) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert results[0] is results[1] is results[2]
+
+
+def test_one_cancelled_waiter_does_not_cancel_the_others():
+    calls = []
+
+    async def scenario():
+        first = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls)))
+        second = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls)))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario())["status"] == "completed"
+    assert len(calls) == 1
+
+
+def test_last_waiter_cancels_the_run():
+    cancelled = []
+
+    async def pipeline(emit):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        first = asyncio.ensure_future(single_flight.run("T-1", pipeline))
+        second = asyncio.ensure_future(single_flight.run("T-1", pipeline))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        second.cancel()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    assert cancelled == [True]
+    assert "T-1" not in single_flight._in_flight
+
+
+def test_caller_arriving_after_cancellation_gets_a_new_run():
+    calls = []
+
+    async def slow_to_unwind(emit):
+        calls.append("first")
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.05)
+            raise
+
+    async def scenario():
+        first = asyncio.ensure_future(single_flight.run("T-1", slow_to_unwind))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0)
+        return await single_flight.run("T-1", _pipeline(calls))
+
+    assert asyncio.run(scenario())["status"] == "completed"
+    assert calls == ["first", None]
+    assert "T-1" not in single_flight._in_flight
+
+
+def test_late_subscriber_gets_earlier_events_replayed():
+    calls, first_events, late_events = [], [], []
+
+    async def scenario():
+        first = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls), on_event=first_events.append))
+        await asyncio.sleep(0.01)
+        await single_flight.run("T-1", _pipeline(calls), on_event=late_events.append)
+        await first
+
+    asyncio.run(scenario())
+
+    assert [m["event"] for m in late_events] == ["ticket_fetched"]
+    assert late_events == first_events
+
+
+def test_caller_with_other_revision_gets_a_fresh_run():
+    calls = []
+
+    async def scenario():
+        old = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls, revision=R1)))
+        await asyncio.sleep(0.01)
+        same = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls, revision=R1), revision=R1))
+        unknown = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls, revision=R1)))
+        newer = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls, revision=R2), revision=R2))
+        return await asyncio.gather(old, same, unknown, newer)
+
+    old, same, unknown, newer = asyncio.run(scenario())
+
+    assert calls == [R1, R2]
+    assert old is same is unknown
+    assert newer["updated"] == R2
+
+
+def test_result_window_reuses_completed_result_for_same_revision(monkeypatch):
+    monkeypatch.setattr(settings, "RESULT_WINDOW_SECONDS", 60)
+    calls = []
+
+    async def scenario():
+        await single_flight.run("T-1", _pipeline(calls, revision=R1))
+        await single_flight.run("T-1", _pipeline(calls, revision=R1))
+        await single_flight.run("T-1", _pipeline(calls, revision=R1), revision=R1)
+        await single_flight.run("T-1", _pipeline(calls, revision=R2), revision=R2)
+
+    asyncio.run(scenario())
+
+    assert calls == [R1, R2]
+
+
+def test_result_window_does_not_reuse_failed_results(monkeypatch):
+    monkeypatch.setattr(settings, "RESULT_WINDOW_SECONDS", 60)
+    calls = []
+    timed_out = {"status": "timed_out", "timed_out_stage": "ui_tests"}
+
+    async def scenario():
+        await single_flight.run("T-1", _pipeline(calls, result=timed_out))
+        await single_flight.run("T-1", _pipeline(calls, result={"error": "Jira down"}))
+        await single_flight.run("T-1", _pipeline(calls))
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 3
+
+
+def test_stale_webhook_attaches_to_run_for_newer_revision():
+    calls = []
+
+    async def scenario():
+        current = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls, revision=R2)))
+        await asyncio.sleep(0.01)
+        stale = asyncio.ensure_future(single_flight.run("T-1", _pipeline(calls, revision=R1), revision=R1))
+        return await asyncio.gather(current, stale)
+
+    current, stale = asyncio.run(scenario())
+
+    assert calls == [R2]
+    assert stale is current
+
+
+def test_result_window_serves_stale_webhook(monkeypatch):
+    monkeypatch.setattr(settings, "RESULT_WINDOW_SECONDS", 60)
+    calls = []
+
+    async def scenario():
+        await single_flight.run("T-1", _pipeline(calls, revision=R2))
+        return await single_flight.run("T-1", _pipeline(calls, revision=R1), revision=R1)
+
+    assert asyncio.run(scenario())["updated"] == R2
+    assert calls == [R2]
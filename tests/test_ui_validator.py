@@ -0,0 +1,103 @@
+import asyncio
+import subprocess
+import sys
+import textwrap
+import pytest
+from app.services import ui_validator
+
+
+@pytest.fixture
+def fake_worker(tmp_path, monkeypatch):
+    """Point ui_validator at a stand-in worker script with the given body."""
+    def make(body):
+        script = tmp_path / "fake_worker.py"
+        script.write_text(textwrap.dedent(body))
+        monkeypatch.setattr(ui_validator, "WORKER_SCRIPT", str(script))
+    return make
+
+
+def test_each_line_is_parsed_and_reported(fake_worker):
+    fake_worker("""
+        import json
+        print(json.dumps({"step": "a", "status": "passed"}), flush=True)
+        print("", flush=True)
+        print(json.dumps({"step": "b", "status": "failed", "error": "boom"}), flush=True)
+    """)
+    reported = []
+
+    results = ui_validator._run_playwright_worker(["a", "b"], timeout=30, on_result=reported.append)
+
+    assert results == [
+        {"step": "a", "status": "passed"},
+        {"step": "b", "status": "failed", "error": "boom"},
+    ]
+    assert reported == results
+
+
+def test_malformed_line_becomes_error_entry(fake_worker):
+    fake_worker("""
+        import json
+        print("not json", flush=True)
+        print(json.dumps({"step": "a", "status": "passed"}), flush=True)
+    """)
+
+    results = ui_validator._run_playwright_worker(["a"], timeout=30)
+
+    assert results == [
+        {"error": "Failed to parse Playwright test result."},
+        {"step": "a", "status": "passed"},
+    ]
+
+
+def test_crash_produces_exactly_one_error_entry(fake_worker):
+    fake_worker("""
+        import json, sys
+        print(json.dumps({"step": "a", "status": "passed"}), flush=True)
+        print("[WORKER ERROR] browser exploded", file=sys.stderr)
+        sys.exit(1)
+    """)
+
+    results = ui_validator._run_playwright_worker(["a", "b"], timeout=30)
+
+    assert results[0] == {"step": "a", "status": "passed"}
+    assert len(results) == 2
+    assert "browser exploded" in results[1]["error"]
+
+
+def test_timeout_keeps_finished_steps(fake_worker):
+    fake_worker("""
+        import json, time
+        print(json.dumps({"step": "a", "status": "passed"}), flush=True)
+        time.sleep(30)
+    """)
+
+    results = ui_validator._run_playwright_worker(["a", "b"], timeout=1)
+
+    assert results[0] == {"step": "a", "status": "passed"}
+    assert results[1]["timed_out"] is True
+
+
+def test_run_ui_tests_reports_results_on_event_loop(fake_worker):
+    fake_worker("""
+        import json
+        print(json.dumps({"step": "a", "status": "passed"}), flush=True)
+    """)
+    reported = []
+
+    async def scenario():
+        results = await ui_validator.run_ui_tests(["a"], timeout=30, on_result=reported.append)
+        await asyncio.sleep(0)
+        return results
+
+    assert asyncio.run(scenario()) == [{"step": "a", "status": "passed"}]
+    assert reported == [{"step": "a", "status": "passed"}]
+
+
+def test_real_worker_reports_crash_on_stderr_only():
+    result = subprocess.run(
+        [sys.executable, ui_validator.WORKER_SCRIPT, "not json"], capture_output=True, text=True
+    )
+
+    assert result.returncode == 1
+    assert result.stdout == ""
+    assert "[WORKER ERROR]" in result.stderr